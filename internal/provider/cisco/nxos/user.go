@@ -132,8 +132,7 @@ func (p PBKDF2) Encode(password string) (string, PwdEncryptType, error) {
 	if err != nil {
 		return "", "", err
 	}
-	pwd := "$nx-pbkdf2$" + CiscoEncoding.EncodeToString(p.Salt[:]) + "$" + CiscoEncoding.EncodeToString(k)
-	return pwd, PwdEncryptTypePbkdf2, nil
+	return encodeHash("nx-pbkdf2", p.Salt[:], k), PwdEncryptTypePbkdf2, nil
 }
 
 type Scrypt struct{ Salt [10]byte }
@@ -143,8 +142,7 @@ func (s Scrypt) Encode(password string) (string, PwdEncryptType, error) {
 	if err != nil {
 		return "", "", err
 	}
-	pwd := "$nx-scrypt$" + CiscoEncoding.EncodeToString(s.Salt[:]) + "$" + CiscoEncoding.EncodeToString(k)
-	return pwd, PwdEncryptTypeScrypt, nil
+	return encodeHash("nx-scrypt", s.Salt[:], k), PwdEncryptTypeScrypt, nil
 }
 
 // CiscoEncoding is the non-stanard, not documented alphabet used by Cisco for their
@@ -153,6 +151,21 @@ func (s Scrypt) Encode(password string) (string, PwdEncryptType, error) {
 // Taken from: https://github.com/BrettVerney/ciscoPWDhasher/blob/master/CiscoPWDhasher/__init__.py#L8-L11
 var CiscoEncoding = base64.NewEncoding("./0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz").WithPadding(base64.NoPadding)
 
+// encodeHash formats a password hash as $<algo>$<salt>$<hash>, encoding both
+// salt and hash with the [CiscoEncoding]. The result is built in a single
+// buffer to avoid allocating intermediate strings for each of the parts.
+func encodeHash(algo string, salt, key []byte) string {
+	n := len(algo) + CiscoEncoding.EncodedLen(len(salt)) + CiscoEncoding.EncodedLen(len(key)) + 3
+	b := make([]byte, 0, n)
+	b = append(b, '$')
+	b = append(b, algo...)
+	b = append(b, '$')
+	b = CiscoEncoding.AppendEncode(b, salt)
+	b = append(b, '$')
+	b = CiscoEncoding.AppendEncode(b, key)
+	return string(b)
+}
+
 func ParsePasswordSalt(hash string) (salt [10]byte, err error) {
 	// Expected hash format: $<algo>$<salt>$<hash>
 	parts := strings.SplitN(hash, "$", 4)